@@ -1,44 +1,86 @@
 import re
+import os
 import json
-import glob
-import inspect
+import sys
 import typing
+import concurrent.futures
 
-# Source language used by the calling script for translatable strings. This should always be set.
-__source_lang = None
+# Use the RE2 engine to scan scripts for translatable strings if it is installed. It matches
+# in linear time without backtracking; otherwise fall back to the builtin re module.
+try:
+    import re2 as __scanner
+except ImportError:
+    __scanner = re
 
-# Target language to translate to. If this is the same as source_lang or is None,
-# the module will function as a passthrough and not translate anything.
-__target_lang = None
+# Likewise, parse translation files with orjson if it is installed, as it is several times
+# faster than the builtin json module. Both are given the raw bytes of the file.
+try:
+    import orjson
+    __json_loads = orjson.loads
+except ImportError:
+    __json_loads = json.loads
 
-# A dictionary to store loaded translation data. It will be populated by __load_translations(),
-# which is called by various functions in this module as needed. Data structure is as follows:
+# A cache of translation files that have already been parsed, so that switching languages or
+# calling helpers such as getlangs() doesn't re-read and re-parse the same file each time.
+# Each translation dict maps source phrases to their translations, as follows:
 # {"Source phrase in source language" : "Translated version of source phrase"}
-__translations: typing.Dict[str, str] = {}
+# Files are keyed by their absolute path, as the source directory is relative to the current
+# working directory. A cached file is reused only while its modification time (in nanoseconds)
+# and size are both unchanged. Data structure is as follows:
+# {absolute path of file : ((modification time of file, size of file), translation dict)}
+__file_cache: typing.Dict[str, typing.Tuple[typing.Tuple[int, int], typing.Dict[str, str]]] = {}
 
-# A function to load a translation file from the source directory. A target_lang
-# must always be passed, as it will define the name of the file to be searched
+# A cache of the translatable strings found in script files by __scan_translatables().
+# A cached scan is reused only while the file's modification time (in nanoseconds) and size
+# are both unchanged. Data structure is as follows:
+# {filename : ((modification time of file, size of file), translatable strings)}
+__scan_cache: typing.Dict[str, typing.Tuple[typing.Tuple[int, int], typing.Tuple[str, ...]]] = {}
+
+# A marker returned by dict lookups for keys that are missing, so that a key can be
+# looked up once and told apart from one whose value is None.
+__missing = object()
+
+# A precompiled regex to find translatable strings formatted as _("Translatable") in a script.
+# The text before the call can't contain a "#", so calls that are inside a comment are never
+# matched, and the translatable string itself is captured in the "s" group.
+# Multiline mode is set inline, as RE2 doesn't accept the flags argument of re.compile().
+__translatable_regex = __scanner.compile(r'(?m)^[^#\n]*_\(["\'](?P<s>.+?)["\']\)')
+
+# A function to load a translation file from the source directory and return its data.
+# A target_lang must always be passed, as it will define the name of the file to be searched
 # for by this function--The full name of the file being target_lang + ".translation"
-def __load_translations(target_lang):
+def __load_translations(target_lang) -> typing.Dict[str, str]:
     
-    # In this function we'll need access to the global var "__translations".
-    global __translations
-    
-    # That being done, attempt to find the specified file.
+    # Attempt to find the specified file.
     try:
         
+        # Get the absolute path of the file, along with its modification time and size,
+        # so we can tell if it has changed since it was cached.
+        path = os.path.abspath(target_lang+".translation")
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        
+        # If this file was already parsed and hasn't changed since, reuse the cached data.
+        cached = __file_cache.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
         # This context handler tries to open the specified file, target_lang + ".translation",
-        # in the source directory. If successful, it loads the json in that file and stores
-        # the resulting dict of translation data to the global var "__translations".
-        with open(target_lang+".translation", "r", encoding='utf-8') as read_file:
-            __translations = json.load(read_file)
+        # in the source directory. If successful, it loads the json in that file.
+        with open(path, "rb") as read_file:
+            translations = __json_loads(read_file.read())
+        
+        # Store the parsed data in the cache for next time, and return it.
+        __file_cache[path] = (version, translations)
+        return translations
             
     # If a matching filename is not found for the given target_lang,
     except FileNotFoundError:
         # Reraise an error denoting that the requested file is missing.
         raise FileNotFoundError("No translation file found for target language '" + target_lang + "'.")
     
-    # If an error occurs parsing the json in the file,
+    # If an error occurs parsing the json in the file (orjson.JSONDecodeError
+    # is a subclass of this, so errors from either parser are caught here),
     except json.decoder.JSONDecodeError as err:
         # Reraise an error denoting the problem and its location within the file.
         raise json.decoder.JSONDecodeError("\nCouldn't parse JSON in file '" + target_lang + ".translation'. "
@@ -46,255 +88,212 @@ def __load_translations(target_lang):
                                             +"Location of error in JSON data file", err.doc, err.pos)
 
 
+# A function to find all translatable strings in a script file, in the order they appear.
+# The regex engine does the scanning and comment filtering in a single pass, so all that's
+# left to do in Python is pull the captured string out of each match. The result is cached,
+# so that tools calling several of the functions below on the same script only read and
+# scan it once (or again, if the file has changed since).
+def __scan_translatables(filename):
+    
+    # Get the modification time and size of the file, and if it was already
+    # scanned and hasn't changed since, return the cached result.
+    stat = os.stat(filename)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = __scan_cache.get(filename)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    # Otherwise, get the text of the file,
+    with open(filename, "r") as file:
+        script = file.read()
+    
+    # scan it, and store the result in the cache before returning it.
+    found = tuple(match.group('s') for match in __translatable_regex.finditer(script))
+    __scan_cache[filename] = (version, found)
+    return found
+
+
+# A function to validate a language code passed to one of the functions in this module.
+# A language code must be a str of len 2. If it is not valid, a ValueError is raised that
+# names the offending parameter; otherwise it is returned as lowercase, to standardize case
+# for later matching.
+def __validate_lang(lang, name):
+    if not isinstance(lang, str) or len(lang) != 2:
+        raise ValueError(f"{name} must be a two character string, such as 'en' or 'pl'.")
+    return lang.lower()
+
+
 # The function used by the calling script to initialize the translation functions.
 # It will be passed a source_lang and optionally a target_lang, both strings.
 # If target_lang is None, the translator will be setup for passthrough of the source lang.
 
-# This function returns a reference to the function __gettext(), which does the actual translating;
+# This function returns a translation function, which does the actual translating;
 # thus when this translator() function is called, its return should be stored to "_" in
 # the calling script so translation can be accessed by the call _('Text to be translated.')
 
 def get_lang_readable_name(lang):
+    # lang is a required field and must be a valid language code.
+    lang = __validate_lang(lang, "lang")
+    
     # Note: for english, which we don't expect there to
     # usually be a translation file for, bypass:
     if lang == 'en':
         return "English"
     
-    # lang is a required field and must be a str of len 2.
-    if type(lang) is not str or len(lang) != 2:
-        # If it is not valid, raise a ValueError.
-        raise ValueError("source_lang must be a two character string, such as 'en' or 'pl'.")
-    
-    # Otherwise, if the passed lang is valid,
+    # Otherwise, for any other lang,
     else:
-        # Backup any current data in __translations so we can
-        # restore it at the end of this function.
-        global __translations
-        temptrans = __translations
-        
-        # Load translation data for lang:
-        __load_translations(lang)
-        
-        # Get the readable name of the language:
-        output = __translations["__target_lang_readable"]
+        # Read translation data for lang.
+        translations = __load_translations(lang)
         
-        # restore the temporary translation data from earlier to its known good state:
-        __translations = temptrans
-        
-        # Return
-        return output
+        # Get the readable name of the language, and return it.
+        return translations["__target_lang_readable"]
         
 
 def translator(source_lang, target_lang=None):
     
-    # Source lang is a required field and must be a str of len 2.
-    if type(source_lang) is not str or len(source_lang) != 2:
-        # If it is not valid, raise a ValueError.
-        raise ValueError("source_lang must be a two character string, such as 'en' or 'pl'.")
-    
-    # Otherwise, if the passed source_lang is valid,
-    else:
-        # Store it to the global variable "__source_lang".
-        # It is also stored here as lowercase to standardize
-        # case for later matching.
-        global __source_lang
-        __source_lang = source_lang.lower()
+    # Source lang is a required field and must be a valid language code.
+    # It is stored as lowercase to standardize case for later matching.
+    source_lang = __validate_lang(source_lang, "source_lang")
     
-    # Target language MAY be defined. If it is None, the translation function __gettext()
+    # Target language MAY be defined. If it is None, the returned translation function
     # will act as a passthrough, returning the original source language text.
+    # Otherwise, validate it as we did for the source_lang.
+    if target_lang is not None:
+        target_lang = __validate_lang(target_lang, "target_lang")
     
-    # First, validate the target_lang as we did for the source_lang
-    # (the rules are the same, except this time it can also be None).
+    # Validation of parameters done. The languages and translation data are only ever kept
+    # in local variables, not module globals, so calls to translator() made at the same
+    # time from different threads can't mix up each other's setup.
     
-    # Setup the global variable "__target_lang" to receive data,
-    # if we should find valid data.
-    global __target_lang
+    # Everything the translation function needs is now known and validated, and can't change
+    # without translator() being called again. So rather than one general function that
+    # re-checks the setup on every call, return a function specialized for this setup.
+    # Each one should be assigned in the calling script to "_" so that it can be called
+    # from anywhere using "_()"
     
-    # If no target_lang was passed,
-    if target_lang is None:
-        # set global "__target_name" to None
-        __target_lang = None
+    # If setup for passthrough,
+    if target_lang is None or target_lang == source_lang:
         
-    # If a valid target_lang string was passed,
-    elif type(target_lang) == str and len(target_lang) == 2:
-        # Store it to global "__target_name"
-        # as a lowercase string, as before.
-        __target_lang = target_lang.lower()
+        # Return a function that returns each string as-is, without translation.
+        def _gettext(source_phrase):
+            return source_phrase
         
-    else:
-        # If it is not valid, raise a ValueError.
-        raise ValueError("target_lang must be either a two character string, or the value None.")
+        return _gettext
     
-    # Validation of parameters done. 
- 
-    # Now, if we have a target language to translate to,
-    if __target_lang != None and __target_lang != __source_lang:
-        
-        # attempt to load the translation file. this function will
-        # raise an error if the specified file is not found.
-        __load_translations(__target_lang)
+    # If setup to translate, attempt to load the translation file. this function
+    # will raise an error if the specified file is not found.
+    translations = __load_translations(target_lang)
     
-    # If we don't have a target language to translate to,
-    else:
-        # Reset the global translations dict to empty.
-        global __translations
-        __translations = {}
+    # A function to translate text. The parameter source_phrase is the incoming string
+    # to be translated from the source language to the target language. It will be looked up
+    # in the dict and translated on demand, or if no match is found a KeyError will be thrown.
+    # The translation dict is bound as the default of _translations, which is not meant to be
+    # passed by the caller; this makes it a plain local variable inside the function, which
+    # is the fastest kind of variable access there is.
+    def _gettext(source_phrase, _translations=translations):
+        
+        # Look up the source_phrase directly in the translation dict. On a hit
+        # this is a single hash lookup, rather than a membership test followed
+        # by a second lookup for the value.
+        try:
+            
+            # If found, return the translated phrase.
+            return _translations[source_phrase]
+        
+        # If not found in the dict,
+        except KeyError:
+            
+            # Raise an error stating such.
+            raise KeyError("Source phrase '" + source_phrase
+                           + "' was not found in the translation file for target_lang '"
+                           + target_lang + "'.") from None
     
-    # Finally, return the function gettext. It should be assigned in the calling script to "_" so that
-    # it can be called from anywhere using "_()"
-    return __gettext
+    return _gettext
 
-# A function to translate text. When the user runs the translator() function,
-# a reference to this function is returned such that the user may assign that
-# reference to a variable and call it as needed, such as _("text to be translated")
-# if the reccomended variable of "_" is used.
 
-# The sole parameter, source_phrase, is the incoming string to be translated
-# from __source_lang to __target_lang. It will be looked up in the dict and
-# translated on demand, or if no match is found a KeyError will be thrown.
-def __gettext(source_phrase):
-    
-    # First, confirm that we have a valid __source_lang.
-    if type(__source_lang) != str or len(__source_lang) != 2:
-    
-        # If not, raise an error.
-        raise RuntimeError("The source language of your script has not been set to valid data. "
-                         + "Please make sure it is set in your calling script by first calling "
-                         + "the function translator() with a valid source_lang parameter.")
-    
-    # Next, validate the __target_lang as well.
-    if type(__target_lang) not in [str, type(None)] or \
-            __target_lang is not None and len(str(__target_lang)) != 2:
-        
-        # If it is set to invalid data, raise an error stating such.
-        raise RuntimeError("The target language of your script has been set to a bad value. "
-                         + "Please make sure it is set in your calling script by first calling "
-                         + "the function translator() with a valid target_lang parameter, or "
-                         + "otherwise setting the target_lang to None.")
+# A function to check that the translation file for lang was made for source_lang. It is
+# used by getlangs(), which may run it for several langs at once in separate threads.
+def __check_lang_source(lang, source_lang):
     
-    # Otherwise, if the data is valid,
-    else:
+    try:
+        
+        # try to load the translation file for the lang.
+        translations = __load_translations(lang)
         
-        # If setup for passthrough,
-        if __target_lang == None or __target_lang == __source_lang:
+        # if that load was successful, confirm its "__source_lang" key matches our source_lang.
+        if translations["__source_lang"].lower() != source_lang:
             
-            # Return the string as-is, without translation.
-            return source_phrase
+            # If the above validation failed, raise an error.
+            raise RuntimeError("The translation file for '" + lang + "' defines a source language of '"
+                               + translations["__source_lang"].lower() + "' which does not match the "
+                               + "program's specified source language of '" + source_lang + "'.")
+    
+    # If the load of translation data failed or was invalid:
+    except RuntimeError as e:
+        
+        # Catch and reraise the above mismatched language error if it is what's being excepted:
+        if "does not match" in str(e):
+            raise e
         
-        # If setup to translate,
+        # If any other error was raised, reraise as a general loading error.
         else:
-            
-            # Check the translation dict for the source_phrase as a key.
-            if source_phrase in __translations.keys():
-                
-                # If found, return the translated phrase.
-                return __translations[source_phrase]
-            
-            # If not found in the dict,
-            else:
-                
-                # Raise an error stating such.
-                raise KeyError("Source phrase '" + source_phrase
-                               + "' was not found in the translation file for target_lang '"
-                               + __target_lang + "'.")
+            raise RuntimeError("Could not load the translation file for '" + lang
+                               + "'. Please check the file for errors.")
 
 
 # Function to return what language packs are installed.
 # These will be files in the source directory with the extension '.translation'.
-def getlangs(source_lang):
+# If validate is True, each language pack is also loaded to check that it was made for
+# source_lang; otherwise the list is built from the filenames alone, without opening them.
+def getlangs(source_lang, validate=False):
     
-    # source_lang should be a string and always should be provided to this function.
-    if type(source_lang) is not str or len(source_lang) != 2:
-        raise ValueError("source_lang must be a string of exactly two characters in length.")
+    # source_lang should be a valid language code and always should be provided to this function.
+    source_lang = __validate_lang(source_lang, "source_lang")
     
     # We always support the source language used in the script itself.
-    # Convert it to lowercase, and store it at the top of the list.
-    source_lang = source_lang.lower()
+    # Store it at the top of the list.
     langs = [source_lang]
     
-    # Add to this list another list of files with the .translation extension
-    # that were found in the source directory.
-    langs = langs + glob.glob("*.translation")
-    
-    # Trim all language strings to 2 characters.
-    langs = [lang[:2] for lang in langs]
-    
-    # save the currently loaded translation data, for restoration later. 
-    global __translations
-    temptrans = __translations
-    
-    # Iterate over all found langs to validate their data
-    for lang in langs:
-        
-        # Bypass checks for the source language, as it won't need any translation data loaded.
-        if lang == source_lang:
-            continue
-        
-        # For other language packs found in the source directory:
-        try:
-            
-            # try to load the translation file for the current lang.
-            __load_translations(lang)
-            
-            # if that load was successful, confirm its "__source_lang" key matches our source_lang.
-            if __translations["__source_lang"].lower() != source_lang:
-                
-                # If the above validation failed, raise an error.
-                raise RuntimeError("The translation file for '" + lang + "' defines a source language of '"
-                                   + __translations["__source_lang"].lower() + "' which does not match the "
-                                   + "program's specified source language of '" + source_lang + "'.")
-        
-        # If the load of translation data failed or was invalid:
-        except RuntimeError as e:
-            
-            # Catch and reraise the above mismatched language error if it is what's being excepted:
-            if "does not match" in str(e):
-                raise e
-            
-            # If any other error was raised, reraise as a general loading error.
-            else:
-                raise RuntimeError("Could not load the translation file for '" + lang
-                                   + "'. Please check the file for errors.")
-        
-        # And no matter what happens above, always:
-        finally:
-            
-            # restore the temporary translation data from earlier to its known good state.
-            __translations = temptrans
+    # Add to this list the language of each file with the .translation extension
+    # that was found in the source directory, this being the filename without its extension.
+    # Only names that are valid language codes (two characters, as __validate_lang() requires)
+    # are listed, so this never returns a language the other functions in this module refuse.
+    # os.scandir() reads the names and types of the entries in a single pass over the directory.
+    # Hidden files (names starting with ".") are skipped, as glob.glob() did before.
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            lang, extension = os.path.splitext(entry.name)
+            if extension == '.translation' and len(lang) == 2 and entry.is_file():
+                langs.append(lang)
+    
+    # If validation wasn't requested, return the list of available langs as-is.
+    if not validate:
+        return langs
+    
+    # Otherwise, validate the data of all found langs, other than the source language which won't need
+    # any translation data loaded. The files are read in a thread pool so that waiting on
+    # the disk for one file overlaps with reading the others. map() keeps results in order,
+    # and reraises the first error raised by any of the checks.
+    otherlangs = [lang for lang in langs if lang != source_lang]
+    if len(otherlangs) > 0:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(otherlangs))) as executor:
+            list(executor.map(__check_lang_source, otherlangs, [source_lang] * len(otherlangs)))
     
     # Lastly, if all langs loaded successfully, return the list of available langs.
     return langs
 
 # Function to generate a skeleton template for translation files.
 def get_data_template(source_lang, target_lang):
-    # Source lang is a required field and must be a str of len 2.
-    if type(source_lang) is not str or len(source_lang) != 2:
-        # If it is not valid, raise a ValueError.
-        raise ValueError("source_lang must be a two character string, such as 'en' or 'pl'.")
-    
-    # Otherwise, if the passed source_lang is valid,
-    else:
-        # Store it to the local variable "__source_lang".
-        # It is also stored here as lowercase to standardize
-        # case for later matching.
-        source_lang = source_lang.lower()
-    
-    # Next, validate the target_lang as we did for the source_lang.
-        
-    # If a valid target_lang string was passed,
-    if type(target_lang) == str and len(target_lang) == 2:
-        # Store it to local "target_name"
-        # as a lowercase string, as before.
-        target_lang = target_lang.lower()
-        
-    else:
-        # If it is not valid, raise a ValueError.
-        raise ValueError("target_lang must be a two character string, such as 'en' or 'pl'.")
+    # Source lang and target lang are required fields and must be valid language codes.
+    source_lang = __validate_lang(source_lang, "source_lang")
+    target_lang = __validate_lang(target_lang, "target_lang")
     
     # Validation of parameters done.
     
     # Get the source file for the calling script:
-    caller = inspect.stack()[1].filename
+    caller = sys._getframe(1).f_code.co_filename
     
     # Populate required special fields into a dict named data,
     # to which we will also add found translatable strings.
@@ -304,63 +303,28 @@ def get_data_template(source_lang, target_lang):
         "__target_lang_readable": ""
         }
     
-    # Get the text of the calling file:
-    with open(caller, 'r') as file:
-        script = file.read()
-    
-    # Create an iterator to find all matches in the code for the
-    # following regex which will match strings formatted as _("Translatable")
-    matches = re.finditer(r'^.*_\(["\'](.+?)["\']\).*$', script, re.M)
-        
-    # Iterate matches,
-    for match in matches:
-        
-        # and if the line is not a comment,
-        if re.search(r'^.*#', match.group(0), re.M) is None:
-            
-            # add the match group to the data dict.
-            data.update({match.group(1) : ""})
+    # Find all translatable strings in the calling file and add them to the data dict.
+    data.update(dict.fromkeys(__scan_translatables(caller), ""))
         
     return json.dumps(data, indent=4)
 
 # Function to cleanup a translation file,
 # identifying unused translation data.
 def cleanup_translation_data(target_lang):
-    # lang is a required field and must be a str of len 2.
-    if type(target_lang) is not str or len(target_lang) != 2:
-        # If it is not valid, raise a ValueError.
-        raise ValueError("target_lang must be a two character string, such as 'en' or 'pl'.")
+    # target_lang is a required field and must be a valid language code.
+    target_lang = __validate_lang(target_lang, "target_lang")
     
     # Get the filename of the source (calling) script:
-    caller = inspect.stack()[1].filename
-    
-    # Get the text of that file:
-    with open(caller, "r") as file:
-        script = file.read()
-        
-    scriptdata = []
+    caller = sys._getframe(1).f_code.co_filename
     
-    # Create an iterator to find all matches in the code for the
-    # following regex which will match strings formatted as _("Translatable")
-    matches = re.finditer(r'^.*_\(["\'](.+?)["\']\).*$', script, re.M)
-        
-    # Iterate matches,
-    for match in matches:
+    # Find all translatable strings in that file. These are stored as a set,
+    # as they will only be used to check whether a phrase is in the code.
+    scriptdata = set(__scan_translatables(caller))
         
-        # and if the line is not a comment,
-        if re.search(r'^.*#', match.group(0), re.M) is None:
-            
-            # add the match group to the scriptdata dict.
-            scriptdata = scriptdata + [match.group(1)]
-        
-    # Before messing with translation data, make a backup:
-    global __translations
-    transbackup = __translations
-    
-    # Next, try to load translation data for target_lang
-    __load_translations(target_lang)
+    # Next, try to read translation data for target_lang.
+    translations = __load_translations(target_lang)
     
-    translationfiledata = list(__translations.keys())
+    translationfiledata = list(translations)
     
     # Create a report to hold found errors:
     report = []
@@ -376,7 +340,7 @@ def cleanup_translation_data(target_lang):
         if phrase not in scriptdata:
             
             # If it doesn't, add it to the report.
-            report = report + ["'" + phrase + "' was not found in the source code."]
+            report.append("'" + phrase + "' was not found in the source code.")
     
     return "\n".join(report)
 
@@ -384,38 +348,14 @@ def cleanup_translation_data(target_lang):
 # source file have a translation for a given language.
 def validate_translation_data(source_lang, target_lang):
 
-    # Source lang is a required field and must be a str of len 2.
-    if type(source_lang) is not str or len(source_lang) != 2:
-        # If it is not valid, raise a ValueError.
-        raise ValueError("source_lang must be a two character string, such as 'en' or 'pl'.")
-    
-    # Otherwise, if the passed source_lang is valid,
-    else:
-        # Store it to the local variable "__source_lang".
-        # It is also stored here as lowercase to standardize
-        # case for later matching.
-        source_lang = source_lang.lower()
-    
-    # Next, validate the target_lang as we did for the source_lang.
-        
-    # If a valid target_lang string was passed,
-    if type(target_lang) == str and len(target_lang) == 2:
-        # Store it to local "target_name"
-        # as a lowercase string, as before.
-        target_lang = target_lang.lower()
-        
-    else:
-        # If it is not valid, raise a ValueError.
-        raise ValueError("target_lang must be a two character string, such as 'en' or 'pl'.")
+    # Source lang and target lang are required fields and must be valid language codes.
+    source_lang = __validate_lang(source_lang, "source_lang")
+    target_lang = __validate_lang(target_lang, "target_lang")
     
     # Validation of parameters done.
     
     # Get the filename of the source (calling) script:
-    caller = inspect.stack()[1].filename
-    
-    # Get the text of that file:
-    with open(caller, "r") as file:
-        script = file.read()
+    caller = sys._getframe(1).f_code.co_filename
     
     # Initialize a data dict with the required "__source_lang" and "__target_lang" fields:
     scriptdata = {
@@ -424,28 +364,14 @@ def validate_translation_data(source_lang, target_lang):
         "__target_lang_readable": ""
         }
     
-    # Create an iterator to find all matches in the code for the
-    # following regex which will match strings formatted as _("Translatable")
-    matches = re.finditer(r'^.*_\(["\'](.+?)["\']\).*$', script, re.M)
-        
-    # Iterate matches,
-    for match in matches:
-        
-        # and if the line is not a comment,
-        if re.search(r'^.*#', match.group(0), re.M) is None:
-            
-            # add the match group to the scriptdata dict.
-            scriptdata.update({match.group(1) : ""})
+    # Find all translatable strings in that file and add them to the scriptdata dict.
+    scriptdata.update(dict.fromkeys(__scan_translatables(caller), ""))
         
     # Get subset of special keys in dict:
     specialkeys = dict({(key, value) for key, value in scriptdata.items() if key[:2] == "__"})
     
-    # Before messing with translation data, make a backup:
-    global __translations
-    transbackup = __translations
-    
-    # Next, try to load translation data for target_lang
-    __load_translations(target_lang)
+    # Next, try to read translation data for target_lang.
+    translations = __load_translations(target_lang)
     
     # Create variables to hold reports of any missing strings
     # and incomplete/invalid translations found in the file:
@@ -453,20 +379,24 @@ def validate_translation_data(source_lang, target_lang):
     incompletes: typing.List[str] = []
     
     # For every translatable key in the source file:
-    for key in scriptdata.keys():
+    for key in scriptdata:
+        
+        # Look up its translation once. Missing keys return the __missing marker,
+        # as None is a value that can legitimately appear in the translation file.
+        translation = translations.get(key, __missing)
         
         # If that key does not exist in the translation file as well,
-        if key not in __translations.keys():
+        if translation is __missing:
             
             # Add it to the missings report.
-            missings = missings + ['    "' + key + '": None,\n']
+            missings.append('    "' + key + '": None,\n')
         
         # Otherwise, if the key exists on file but doesn't have a valid translation:
-        elif type(__translations[key]) != str or len(__translations[key].strip()) < 1:
+        elif not isinstance(translation, str) or len(translation.strip()) < 1:
             
             # Add it to the incompletes report.
-            incompletes = incompletes + ["(!) Source phrase '" + key
-                          + "' exists in file but has no valid translation to return."]
+            incompletes.append("(!) Source phrase '" + key
+                               + "' exists in file but has no valid translation to return.")
         
     # Build the final report of errors, if errors were found:
     if len(incompletes) > 0 or len(missings) > 0:
@@ -478,10 +408,10 @@ def validate_translation_data(source_lang, target_lang):
         if len(missings) > 0:
             
             # Add a header line for missings,
-            report = report + ["(!) Source phrase for the following keys does not exist on file:"]
+            report.append("(!) Source phrase for the following keys does not exist on file:")
             
             # Then add the missings to the report.
-            report = report + missings
+            report.extend(missings)
         
         # Combine the report (currently a list of strings)
         # into one large string with newline splits.
@@ -497,12 +427,6 @@ def validate_translation_data(source_lang, target_lang):
         # Raise it as a warning.
         raise RuntimeWarning("Errors found in translation data:\n" + report)
         
-        
-    # Before returning from the function,
-    # restore the translation data backup to its
-    # state before the function was run:
-    __translations = transbackup
-    
     # Finally, if we made it this far without errors, return a string
     # describing what data was found in the file.
     return "Found " + str(len(scriptdata) - len(specialkeys)) \